@@ -6,33 +6,373 @@ Perfecto para probar la estructura de datos antes de insertar en MongoDB.
 """
 
 import pandas as pd
-import json
+from pandas.io.parsers import TextParser
+import orjson
 import argparse
+import os
+import re
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 import sys
 from pathlib import Path
 
-def leer_excel(ruta_archivo, hoja=None):
+MOTORES = ("pandas", "polars", "openpyxl-readonly")
+FORMATO_FECHA = "%Y-%m-%dT%H:%M:%S"
+_CARACTERES_INVALIDOS = re.compile(r'[^A-Za-z0-9_]')
+_ENCABEZADO_VACIO_POLARS = re.compile(r'^__UNNAMED__(\d+)$')
+
+try:
+    import pyarrow  # noqa: F401
+    DTYPE_BACKEND = "pyarrow"
+except ImportError:  # Sin pyarrow se usan los tipos anulables de pandas
+    DTYPE_BACKEND = "numpy_nullable"
+
+def _posiciones_columnas(usecols):
+    """
+    Traduce usecols en notación de Excel ("A:C,E") a posiciones de columna.
+
+    Args:
+        usecols (str | list | callable): Columnas a leer
+
+    Returns:
+        list | callable: Posiciones de columna si usecols es texto; si no, usecols sin cambios
+    """
+    if not isinstance(usecols, str):
+        return usecols
+
+    from openpyxl.utils import column_index_from_string
+
+    posiciones = []
+    for rango in usecols.replace(" ", "").split(","):
+        inicio, _, fin = rango.partition(":")
+        inicio = column_index_from_string(inicio) - 1
+        fin = column_index_from_string(fin) - 1 if fin else inicio
+        posiciones.extend(range(inicio, fin + 1))
+    return posiciones
+
+def _convertir_celda(valor):
+    """Convierte una celda de openpyxl igual que los lectores de pd.read_excel."""
+    if valor is None:
+        return ""
+    if isinstance(valor, float) and valor.is_integer():
+        return int(valor)
+    return valor
+
+def _formatear_fecha(valor):
+    """Da formato FORMATO_FECHA a un valor de fecha; cualquier otro valor se deja igual."""
+    if isinstance(valor, date) and not pd.isna(valor):
+        return valor.strftime(FORMATO_FECHA)
+    return valor
+
+def _convertir_tipos(df):
+    """
+    Pasa las columnas a tipos anulables (Arrow si pyarrow está instalado).
+
+    convert_dtypes solo cambia las columnas de un único tipo; las que mezclan
+    tipos (p. ej. por filas de metadatos sobre la tabla) quedan como object
+    para no convertir sus números en texto, y sus fechas se escriben en
+    FORMATO_FECHA igual que las columnas datetime.
+
+    Args:
+        df (pandas.DataFrame): DataFrame recién leído
+
+    Returns:
+        pandas.DataFrame: DataFrame con tipos anulables
+    """
+    df = df.convert_dtypes(dtype_backend=DTYPE_BACKEND)
+    for i, tipo in enumerate(df.dtypes):
+        if pd.api.types.is_object_dtype(tipo):
+            df.isetitem(i, df.iloc[:, i].map(_formatear_fecha))
+    return df
+
+def _leer_con_polars(ruta_archivo, hoja=None, usecols=None, dtype=None, nrows=None):
     """
-    Lee un archivo Excel usando pandas.
+    Lee un archivo Excel con Polars (calamine).
 
     Args:
         ruta_archivo (str): Ruta al archivo Excel
         hoja (str, opcional): Nombre de la hoja a leer
+        usecols (str | list, opcional): Columnas a leer
+        dtype (dict, opcional): Esquema de Polars a aplicar a las columnas
+        nrows (int, opcional): Número máximo de filas a leer
+
+    Returns:
+        polars.DataFrame: DataFrame de Polars
+    """
+    try:
+        import polars as pl  # Polars es opcional; solo se importa con --engine polars
+    except ImportError:
+        raise ImportError("El motor 'polars' requiere 'pip install polars fastexcel'") from None
+
+    # Como pd.read_excel, la primera fila es el encabezado aunque esté vacía
+    opciones_lectura = {"skip_rows": 0}
+    if isinstance(usecols, str):
+        opciones_lectura["use_columns"] = usecols
+    if nrows is not None:
+        opciones_lectura["n_rows"] = nrows
+
+    df_pl = pl.read_excel(
+        ruta_archivo,
+        sheet_name=hoja if hoja else None,
+        engine="calamine",
+        read_options=opciones_lectura,
+        columns=usecols if usecols is not None and not isinstance(usecols, str) else None,
+        schema_overrides=dtype,
+        drop_empty_rows=False,
+        drop_empty_cols=False,
+    )
+    # Mismos nombres que pd.read_excel para los encabezados vacíos
+    df_pl = df_pl.rename(lambda col: _ENCABEZADO_VACIO_POLARS.sub(r"Unnamed: \1", col))
+    return _restaurar_columnas_mixtas(df_pl, ruta_archivo, hoja, usecols, dtype, nrows)
+
+def _restaurar_columnas_mixtas(df_pl, ruta_archivo, hoja, usecols, dtype, nrows):
+    """
+    Da a las columnas que Polars leyó como texto los mismos valores que pandas.
+
+    fastexcel lee como texto completa cualquier columna que mezcla tipos (p. ej.
+    por filas de metadatos sobre la tabla), así que sus números y fechas
+    quedarían como cadenas. Esas columnas se vuelven a leer con _leer_con_pandas
+    y se guardan como pl.Object si conservan valores que no son texto.
+
+    Args:
+        df_pl (polars.DataFrame): DataFrame leído con Polars
+        ruta_archivo (str): Ruta al archivo Excel
+        hoja (str, opcional): Nombre de la hoja leída
+        usecols (str | list, opcional): Columnas leídas
+        dtype (dict, opcional): Esquema de Polars aplicado; esas columnas no se tocan
+        nrows (int, opcional): Número máximo de filas leídas
+
+    Returns:
+        polars.DataFrame: DataFrame con las columnas mixtas restauradas
+    """
+    import polars as pl
+
+    columnas_texto = [i for i, (nombre, tipo) in enumerate(df_pl.schema.items())
+                      if tipo == pl.String and not (dtype and nombre in dtype)]
+    if not columnas_texto:
+        return df_pl
+
+    if usecols is None:
+        # Sin usecols, la posición en el DataFrame es la columna de la hoja: solo se analizan esas
+        df_pd = _leer_con_pandas(ruta_archivo, hoja, columnas_texto, None, nrows)
+        series = [df_pd.iloc[:, j] for j in range(len(columnas_texto))]
+    else:
+        df_pd = _leer_con_pandas(ruta_archivo, hoja, usecols, None, nrows)
+        series = [df_pd.iloc[:, i] for i in columnas_texto]
+
+    for i, serie in zip(columnas_texto, series):
+        valores = serie.to_numpy(dtype=object, na_value=None).tolist()
+        tipo = pl.String if all(valor is None or isinstance(valor, str) for valor in valores) else pl.Object
+        df_pl = df_pl.replace_column(i, pl.Series(df_pl.columns[i], valores, dtype=tipo))
+    return df_pl
+
+def _leer_con_openpyxl(ruta_archivo, hoja=None, usecols=None, dtype=None, nrows=None):
+    """
+    Lee un archivo Excel con openpyxl en modo de solo lectura.
+
+    Evita materializar estilos y fórmulas del libro, que es lo que domina el
+    tiempo de openpyxl en catálogos de miles de filas.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo Excel (.xlsx)
+        hoja (str, opcional): Nombre de la hoja a leer
+        usecols (str | list | callable, opcional): Columnas a leer
+        dtype (type | dict, opcional): Tipos a aplicar a las columnas
+        nrows (int, opcional): Número máximo de filas a leer
 
     Returns:
         pandas.DataFrame: DataFrame con los datos del Excel
     """
+    from openpyxl import load_workbook
+
+    libro = load_workbook(ruta_archivo, read_only=True, data_only=True)
     try:
-        if hoja:
-            df = pd.read_excel(ruta_archivo, sheet_name=hoja)
-            print(f"✓ Hoja '{hoja}' leída desde {ruta_archivo}")
-        else:
-            df = pd.read_excel(ruta_archivo)
-            print(f"✓ Archivo Excel leído: {ruta_archivo}")
-        
-        print(f"  - Filas: {df.shape[0]}, Columnas: {df.shape[1]}")
-        print(f"  - Columnas: {list(df.columns)}")
+        hoja_excel = libro[hoja] if hoja else libro.worksheets[0]
+        # La extensión de la hoja se toma de las celdas con datos, como calamine, y
+        # no de la dimensión declarada por openpyxl. Con nrows solo se recorren el
+        # encabezado y las nrows filas pedidas, así que el ancho es el de esas filas:
+        # a diferencia de pd.read_excel, no aparecen como columnas vacías las que
+        # solo tienen datos más abajo
+        filas = []
+        ultima_fila = -1
+        ancho = 0
+        for i, fila in enumerate(hoja_excel.iter_rows(values_only=True)):
+            usado = len(fila)
+            while usado and (fila[usado - 1] is None or fila[usado - 1] == ""):
+                usado -= 1
+            if nrows is not None and i > nrows:
+                # Pasadas las filas pedidas solo se busca si hay más datos; de haberlos, las
+                # filas vacías al final de las pedidas se conservan, como en pd.read_excel
+                if usado:
+                    ultima_fila = len(filas) - 1
+                if ultima_fila == len(filas) - 1:
+                    break
+                continue
+            if usado:
+                ultima_fila = i
+                ancho = max(ancho, usado)
+            filas.append(fila)
+    finally:
+        libro.close()
+
+    datos = [[_convertir_celda(celda) for celda in fila[:ancho]] for fila in filas[:ultima_fila + 1]]
+    if not datos:
+        return pd.DataFrame()
+    # Las filas vacías dentro de esa extensión se conservan, como en pd.read_excel
+    datos = [fila + [""] * (ancho - len(fila)) for fila in datos]
+
+    # TextParser es el mismo analizador que usa pd.read_excel: da los mismos
+    # encabezados, valores faltantes ("", "N/A", "NA", ...) y tipos
+    parser = TextParser(datos, header=0, usecols=_posiciones_columnas(usecols), dtype=dtype,
+                        nrows=nrows, skip_blank_lines=False)
+    return _convertir_tipos(parser.read(nrows=nrows))
+
+def _leer_con_pandas(ruta_archivo, hoja=None, usecols=None, dtype=None, nrows=None):
+    """
+    Lee un archivo Excel con pandas, usando calamine si está instalado.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo Excel
+        hoja (str, opcional): Nombre de la hoja a leer
+        usecols (str | list | callable, opcional): Columnas a leer
+        dtype (type | dict, opcional): Tipos a aplicar a las columnas
+        nrows (int, opcional): Número máximo de filas a leer
+
+    Returns:
+        pandas.DataFrame: DataFrame con los datos del Excel
+    """
+    opciones = {"sheet_name": hoja if hoja else 0, "usecols": usecols, "dtype": dtype, "nrows": nrows}
+    try:
+        # Se lee con tipos de numpy y se convierte después: con dtype_backend en
+        # read_excel, las columnas mixtas se convertirían completas a texto
+        return _convertir_tipos(pd.read_excel(ruta_archivo, engine="calamine", **opciones))
+    except ImportError:
+        # Sin python-calamine, los .xlsx se leen con openpyxl en modo de solo lectura
+        if Path(ruta_archivo).suffix.lower() in (".xlsx", ".xlsm"):
+            return _leer_con_openpyxl(ruta_archivo, hoja, usecols, dtype, nrows)
+        return _convertir_tipos(pd.read_excel(ruta_archivo, **opciones))
+
+_DESCRIPCION_MOTOR = {"pandas": "", "polars": " con Polars", "openpyxl-readonly": " con openpyxl (solo lectura)"}
+
+_ATRIBUTO_COLUMNAS_JSON = "conversor_columnas_json"
+
+def _ruta_cache(ruta_archivo, hoja, motor):
+    """Ruta del archivo Parquet que guarda la hoja ya leída con el motor indicado."""
+    return Path(f"{ruta_archivo}.{hoja if hoja else 'hoja0'}.{motor}.parquet")
+
+def _leer_cache(ruta_cache, motor):
+    """Lee una hoja guardada por _guardar_cache, restaurando sus columnas mixtas."""
+    if motor == "polars":
+        import polars as pl
+
+        df = pl.read_parquet(ruta_cache)
+        columnas_json = orjson.loads(pl.read_parquet_metadata(ruta_cache).get(_ATRIBUTO_COLUMNAS_JSON, "[]"))
+        for i in columnas_json:
+            valores = [orjson.loads(valor) for valor in df.to_series(i)]
+            df = df.replace_column(i, pl.Series(df.columns[i], valores, dtype=pl.Object))
         return df
+    df = pd.read_parquet(ruta_cache, engine="pyarrow", dtype_backend=DTYPE_BACKEND)
+    for i in df.attrs.pop(_ATRIBUTO_COLUMNAS_JSON, []):
+        df.isetitem(i, pd.Series([orjson.loads(valor) for valor in df.iloc[:, i]], index=df.index, dtype=object))
+    return df
+
+def _guardar_cache(df, ruta_cache, motor):
+    """
+    Guarda la hoja leída en Parquet; si no se puede, solo avisa y sigue.
+
+    Parquet no admite columnas que mezclan tipos (object), así que cada valor
+    de esas columnas (pl.Object en Polars) se guarda como texto JSON y sus
+    posiciones quedan en los metadatos para restaurarlas en _leer_cache.
+    """
+    try:
+        if motor == "polars":
+            import polars as pl
+
+            columnas_json = [i for i, tipo in enumerate(df.dtypes) if tipo == pl.Object]
+            df_cache = df.with_columns(
+                pl.Series(df.columns[i], [orjson.dumps(valor).decode('utf-8') for valor in df.to_series(i)])
+                for i in columnas_json
+            )
+            df_cache.write_parquet(ruta_cache, compression="zstd",
+                                   metadata={_ATRIBUTO_COLUMNAS_JSON: orjson.dumps(columnas_json).decode('utf-8')})
+        else:
+            columnas_json = [i for i, tipo in enumerate(df.dtypes) if pd.api.types.is_object_dtype(tipo)]
+            df_cache = df.copy(deep=False)
+            for i in columnas_json:
+                df_cache.isetitem(i, [orjson.dumps(valor, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+                                      for valor in df.iloc[:, i]])
+            df_cache.attrs = {_ATRIBUTO_COLUMNAS_JSON: columnas_json}
+            df_cache.to_parquet(ruta_cache, engine="pyarrow", compression="zstd")
+    except Exception as e:
+        ruta_cache.unlink(missing_ok=True)
+        print(f"⚠ No se pudo guardar la caché {ruta_cache}: {e}")
+
+def _leer_hoja(ruta_archivo, hoja, motor, usecols, dtype, nrows, cache=False):
+    """
+    Lee una sola hoja con el motor indicado.
+
+    Con cache=True, la hoja se guarda en un Parquet junto al Excel y las
+    siguientes lecturas lo usan mientras sea más reciente que el Excel. La
+    caché guarda la hoja completa, así que se omite si se piden usecols,
+    dtype o nrows.
+    """
+    usar_cache = cache and usecols is None and dtype is None and nrows is None
+    if usar_cache:
+        ruta_cache = _ruta_cache(ruta_archivo, hoja, motor)
+        if ruta_cache.exists() and ruta_cache.stat().st_mtime >= Path(ruta_archivo).stat().st_mtime:
+            return _leer_cache(ruta_cache, motor)
+
+    if motor == "polars":
+        df = _leer_con_polars(ruta_archivo, hoja, usecols, dtype, nrows)
+    elif motor == "openpyxl-readonly":
+        df = _leer_con_openpyxl(ruta_archivo, hoja, usecols, dtype, nrows)
+    else:
+        df = _leer_con_pandas(ruta_archivo, hoja, usecols, dtype, nrows)
+
+    if usar_cache:
+        _guardar_cache(df, ruta_cache, motor)
+    return df
+
+def leer_excel(ruta_archivo, hoja=None, motor="pandas", usecols=None, dtype=None, nrows=None, cache=False):
+    """
+    Lee un archivo Excel usando pandas, Polars u openpyxl en modo de solo lectura.
+
+    Si se pasan varias hojas, se leen en paralelo con un pool de hilos; calamine
+    libera el GIL mientras analiza cada hoja.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo Excel
+        hoja (str | list, opcional): Nombre de la hoja a leer, o lista de hojas
+        motor (str): Motor de lectura, "pandas", "polars" u "openpyxl-readonly"
+        usecols (str | list | callable, opcional): Columnas a leer, p. ej. "A:C,E"
+        dtype (type | dict, opcional): Tipos a aplicar a las columnas
+        nrows (int, opcional): Número máximo de filas a leer
+        cache (bool): Si se usa una caché Parquet junto al Excel para lecturas repetidas
+
+    Returns:
+        pandas.DataFrame | polars.LazyFrame: DataFrame con los datos del Excel;
+            con motor "polars" se entrega un LazyFrame para el resto del proceso.
+            Con una lista de hojas se entrega un dict {hoja: DataFrame}.
+    """
+    varias_hojas = isinstance(hoja, (list, tuple))
+    try:
+        if varias_hojas:
+            with ThreadPoolExecutor(max_workers=min(len(hoja), os.cpu_count() or 1)) as ejecutor:
+                dfs = list(ejecutor.map(lambda h: _leer_hoja(ruta_archivo, h, motor, usecols, dtype, nrows, cache), hoja))
+            leidos = dict(zip(hoja, dfs))
+        else:
+            leidos = {hoja: _leer_hoja(ruta_archivo, hoja, motor, usecols, dtype, nrows, cache)}
+
+        descripcion = _DESCRIPCION_MOTOR.get(motor, "")
+        for nombre, df in leidos.items():
+            if nombre:
+                print(f"✓ Hoja '{nombre}' leída{descripcion} desde {ruta_archivo}")
+            else:
+                print(f"✓ Archivo Excel leído{descripcion}: {ruta_archivo}")
+            print(f"  - Filas: {df.shape[0]}, Columnas: {df.shape[1]}")
+            print(f"  - Columnas: {list(df.columns)}")
     except FileNotFoundError:
         print(f"✗ Archivo no encontrado: {ruta_archivo}")
         sys.exit(1)
@@ -40,66 +380,251 @@ def leer_excel(ruta_archivo, hoja=None):
         print(f"✗ Error al leer el archivo Excel: {e}")
         sys.exit(1)
 
-def limpiar_dataframe(df):
+    if motor == "polars":
+        leidos = {nombre: df.lazy() for nombre, df in leidos.items()}
+    return leidos if varias_hojas else leidos[hoja]
+
+def _es_polars(df):
+    """Indica si df es un DataFrame o LazyFrame de Polars."""
+    # Si Polars no se ha importado, df no puede ser de Polars: no se paga su importación
+    pl = sys.modules.get("polars")
+    return pl is not None and isinstance(df, (pl.DataFrame, pl.LazyFrame))
+
+def _limpiar_nombre(columna):
+    """Reemplaza espacios por '_' y elimina los caracteres no alfanuméricos."""
+    return _CARACTERES_INVALIDOS.sub('', str(columna).replace(' ', '_'))
+
+def _limpiar_nombres(columnas):
+    """
+    Limpia una lista de nombres de columna garantizando que no se repitan.
+
+    Si dos columnas quedan con el mismo nombre (p. ej. 'a b' y 'a_b'), a las
+    siguientes se les agrega el sufijo _1, _2, ... para no perder datos.
+
+    Args:
+        columnas (list): Nombres de columna originales
+
+    Returns:
+        list: Nombres limpios y únicos, en el mismo orden
+    """
+    limpias = [_limpiar_nombre(col) for col in columnas]
+    usados = set()
+    for i, nombre in enumerate(limpias):
+        candidato, n = nombre, 0
+        while candidato in usados:
+            n += 1
+            candidato = f"{nombre}_{n}"
+        usados.add(candidato)
+        limpias[i] = candidato
+    return limpias
+
+def _validar_columnas_vacias(columnas_vacias, columnas_limpias):
+    """Termina con un error si alguna columna de columnas_vacias no existe tras limpiar los nombres."""
+    faltantes = [col for col in columnas_vacias or [] if col not in columnas_limpias]
+    if faltantes:
+        print(f"✗ Columnas no encontradas para --fill-empty: {faltantes}")
+        print(f"  - Columnas disponibles: {columnas_limpias}")
+        sys.exit(1)
+
+def _rellenar_nulos(serie):
+    """Reemplaza los nulos de una Serie de Polars por "" conservando los demás valores."""
+    import polars as pl
+
+    return pl.Series(serie.name, ["" if valor is None else valor for valor in serie.to_list()], dtype=pl.Object)
+
+def _limpiar_lazyframe(lf, columnas_vacias=None):
+    """
+    Limpia un LazyFrame de Polars en un solo plan: fechas a ISO, nombres de
+    columna limpios y, si se piden, nulos a cadena vacía.
+
+    Args:
+        lf (polars.LazyFrame): LazyFrame de entrada
+        columnas_vacias (list, opcional): Columnas (nombres limpios) cuyos nulos se escriben como ""
+
+    Returns:
+        polars.LazyFrame: LazyFrame limpio, aún sin ejecutar
+    """
+    import polars as pl
+
+    columnas_originales = lf.collect_schema().names()
+    columnas_limpias = _limpiar_nombres(columnas_originales)
+    _validar_columnas_vacias(columnas_vacias, columnas_limpias)
+
+    lf = lf.with_columns(pl.col(pl.Date).cast(pl.Datetime))
+    lf = lf.with_columns(pl.col(pl.Datetime).dt.strftime(FORMATO_FECHA))
+    lf = lf.rename(dict(zip(columnas_originales, columnas_limpias)))
+    if columnas_vacias:
+        # Igual que astype(object) en pandas: solo los nulos pasan a "", los números
+        # siguen siendo números, así que las columnas que no son texto pasan a pl.Object
+        esquema = lf.collect_schema()
+        texto = [col for col in columnas_vacias if esquema[col] == pl.String]
+        otras = [col for col in columnas_vacias if esquema[col] != pl.String]
+        lf = lf.with_columns(
+            pl.col(texto).fill_null(""),
+            pl.col(otras).map_batches(_rellenar_nulos, return_dtype=pl.Object),
+        )
+
+    print(f"✓ DataFrame limpiado")
+    if columnas_originales != columnas_limpias:
+        print(f"  - Columnas originales: {columnas_originales}")
+        print(f"  - Columnas limpias: {columnas_limpias}")
+
+    return lf
+
+def limpiar_dataframe(df, columnas_vacias=None):
     """
     Limpia el DataFrame para la conversión a JSON.
 
+    Los valores faltantes se conservan como nulos y se escriben como null en
+    el JSON, salvo en las columnas indicadas en columnas_vacias.
+
     Args:
-        df (pandas.DataFrame): DataFrame de entrada
+        df (pandas.DataFrame | polars.LazyFrame): DataFrame de entrada
+        columnas_vacias (list, opcional): Columnas (nombres limpios) cuyos nulos se escriben como ""
 
     Returns:
-        pandas.DataFrame: DataFrame limpio
+        pandas.DataFrame | polars.LazyFrame: DataFrame limpio, del mismo tipo que la entrada
     """
-    df = df.fillna("")  # Reemplaza NaN por cadenas vacías
+    if _es_polars(df):
+        return _limpiar_lazyframe(df.lazy(), columnas_vacias)
+
+    df = df.copy(deep=False)
 
-    # Convierte columnas datetime a string ISO
-    for col in df.select_dtypes(include=["datetime", "datetimetz"]):
-        df[col] = df[col].astype(str)
+    # Convierte columnas datetime a string ISO de forma vectorizada
+    for col, tipo in df.dtypes.items():
+        if pd.api.types.is_datetime64_any_dtype(tipo):
+            df[col] = df[col].dt.strftime(FORMATO_FECHA)
+            if isinstance(tipo, pd.ArrowDtype):
+                # En Arrow, %S incluye la fracción de segundo; se recorta al formato ISO sin ella
+                df[col] = df[col].str.slice(0, 19)
 
-    columnas_originales = list(df.columns)
-    df.columns = df.columns.str.replace(' ', '_').str.replace('[^a-zA-Z0-9_]', '', regex=True)
+    columnas_originales = df.columns.tolist()
+    columnas_limpias = _limpiar_nombres(columnas_originales)
+    _validar_columnas_vacias(columnas_vacias, columnas_limpias)
 
     print(f"✓ DataFrame limpiado")
-    if columnas_originales != list(df.columns):
+    if columnas_originales != columnas_limpias:
+        df.columns = columnas_limpias
         print(f"  - Columnas originales: {columnas_originales}")
-        print(f"  - Columnas limpias: {list(df.columns)}")
+        print(f"  - Columnas limpias: {columnas_limpias}")
+
+    if columnas_vacias:
+        df = df.astype({col: object for col in columnas_vacias}).fillna({col: "" for col in columnas_vacias})
     
     return df
 
+def _iterar_registros(df):
+    """
+    Genera los registros de un DataFrame de pandas sin pasar por to_dict('records').
+
+    Toma cada columna una sola vez como arreglo y arma los dicts a partir de
+    tuplas de fila, reutilizando la misma tupla de nombres de columna; todo
+    el recorrido ocurre en map/zip, sin un ciclo de Python por fila.
+
+    Args:
+        df (pandas.DataFrame): DataFrame a recorrer
+
+    Returns:
+        iterador de dict: Un dict por fila
+    """
+    columnas = tuple(df.columns.tolist())
+    # dtype=object con na_value=None convierte NaN, NaT y pd.NA en None, que orjson escribe como null
+    arreglos = [df.iloc[:, i].to_numpy(dtype=object, na_value=None) for i in range(len(columnas))]
+    return map(dict, map(zip, repeat(columnas), zip(*arreglos)))
+
+def _escribir_registros(archivo, registros, bonito=True):
+    """
+    Escribe registro por registro un arreglo JSON en un archivo binario abierto.
+
+    Produce la misma salida que serializar la lista completa, sin construir
+    nunca la cadena JSON entera en memoria.
+
+    Args:
+        archivo: Archivo abierto en modo binario
+        registros (iterable de dict): Registros a escribir
+        bonito (bool): Si el JSON debe estar formateado
+    """
+    opciones = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if bonito:
+        opciones |= orjson.OPT_INDENT_2
+    inicio, separador, fin = (b"[\n  ", b",\n  ", b"\n]") if bonito else (b"[", b",", b"]")
+
+    vacio = True
+    for registro in registros:
+        archivo.write(inicio if vacio else separador)
+        json_bytes = orjson.dumps(registro, option=opciones)
+        # Las cadenas JSON no contienen saltos de línea literales, así que es seguro sangrar así
+        archivo.write(json_bytes.replace(b"\n", b"\n  ") if bonito else json_bytes)
+        vacio = False
+    archivo.write(b"[]" if vacio else fin)
+
 def convertir_a_json(df, archivo_salida=None, bonito=True):
     """
     Convierte el DataFrame a JSON.
 
+    Con archivo de salida, el JSON se escribe por registros directamente al
+    archivo en lugar de armarse completo en memoria.
+
     Args:
-        df (pandas.DataFrame): DataFrame a convertir
+        df (pandas.DataFrame | polars.DataFrame | polars.LazyFrame): DataFrame a convertir
         archivo_salida (str, opcional): Ruta del archivo de salida
         bonito (bool): Si el JSON debe estar formateado
 
     Returns:
-        str: Cadena JSON
+        str | None: Cadena JSON, o None si se escribió en archivo_salida
     """
-    registros = df.to_dict('records')
-    if bonito:
-        json_str = json.dumps(registros, indent=2, ensure_ascii=False)
+    if _es_polars(df):
+        import polars as pl
+
+        df = df.collect() if isinstance(df, pl.LazyFrame) else df
+        if not bonito and pl.Object not in df.schema.dtypes():
+            # Polars escribe el JSON compacto en Rust, sin crear objetos de Python;
+            # las columnas mixtas (pl.Object) se escriben con orjson como en pandas
+            json_str = df.write_json(archivo_salida)
+            if archivo_salida:
+                print(f"✓ JSON guardado en: {archivo_salida}")
+            return json_str
+        registros = df.iter_rows(named=True)
     else:
-        json_str = json.dumps(registros, ensure_ascii=False)
-    
+        registros = _iterar_registros(df)
+
     if archivo_salida:
-        with open(archivo_salida, 'w', encoding='utf-8') as f:
-            f.write(json_str)
+        with open(archivo_salida, 'wb') as f:
+            _escribir_registros(f, registros, bonito)
         print(f"✓ JSON guardado en: {archivo_salida}")
-    
-    return json_str
+        return None
 
-def main():
+    opciones = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if bonito:
+        opciones |= orjson.OPT_INDENT_2
+    return orjson.dumps(list(registros), option=opciones).decode('utf-8')
+
+@lru_cache(maxsize=None)
+def _crear_parser():
+    """
+    Construye el ArgumentParser de la línea de comandos una sola vez.
+
+    Solo se invoca desde main(), así que importar el módulo (como hace
+    usoconverter.py) no paga el costo de armar el parser.
+
+    Returns:
+        argparse.ArgumentParser: Parser de los argumentos del convertidor
+    """
     parser = argparse.ArgumentParser(description="Convierte un archivo Excel a JSON")
     parser.add_argument("excel_file", help="Ruta al archivo Excel (.xls o .xlsx)")
-    parser.add_argument("-s", "--sheet", help="Nombre de la hoja a leer (por defecto: primera hoja)")
-    parser.add_argument("-o", "--output", help="Archivo JSON de salida (por defecto: imprime en consola)")
+    parser.add_argument("-s", "--sheet", action="append", help="Nombre de la hoja a leer; repítelo para leer varias hojas en paralelo (por defecto: primera hoja)")
+    parser.add_argument("-o", "--output", help="Archivo JSON de salida; con varias hojas se crea uno por hoja con el sufijo _<hoja> (por defecto: imprime en consola)")
     parser.add_argument("--compact", action="store_true", help="Salida JSON compacta (sin formato bonito)")
     parser.add_argument("--preview", action="store_true", help="Muestra una vista previa de los datos antes de convertir")
-    
-    args = parser.parse_args()
+    parser.add_argument("--usecols", help="Columnas a leer en notación de Excel, p. ej. 'A:C,E' (por defecto: todas)")
+    parser.add_argument("--nrows", type=int, help="Número máximo de filas a leer (por defecto: todas)")
+    parser.add_argument("--cache", action="store_true", help="Guarda cada hoja leída en un Parquet junto al Excel y lo reutiliza mientras el Excel no cambie (requiere pyarrow)")
+    parser.add_argument("--fill-empty", action="append", metavar="COLUMNA", help="Columna (nombre limpio) cuyos vacíos se escriben como \"\" en lugar de null; repítelo para varias")
+    parser.add_argument("--engine", choices=MOTORES, default="pandas", help="Motor de lectura del Excel (por defecto: pandas, con calamine si 'pip install python-calamine' está instalado; polars requiere 'pip install polars fastexcel')")
+    return parser
+
+def main():
+    args = _crear_parser().parse_args()
     
     excel_path = Path(args.excel_file)
     if not excel_path.exists():
@@ -109,32 +634,57 @@ def main():
     print(f"Convertidor de Excel a JSON")
     print(f"=" * 30)
     print(f"Archivo Excel: {args.excel_file}")
-    print(f"Hoja: {args.sheet or 'Primera hoja'}")
+    print(f"Hoja: {', '.join(args.sheet) if args.sheet else 'Primera hoja'}")
+    print(f"Motor: {args.engine}")
     if args.output:
         print(f"Salida: {args.output}")
     print()
     
-    df = leer_excel(args.excel_file, args.sheet)
-    
-    if args.preview:
-        print("\n📋 Vista previa de los datos:")
-        print(df.head())
-        print(f"\nTipos de datos:")
-        print(df.dtypes)
-        print()
-    
-    df = limpiar_dataframe(df)
+    if args.sheet and len(args.sheet) > 1:
+        dfs = leer_excel(args.excel_file, args.sheet, args.engine, usecols=args.usecols, nrows=args.nrows, cache=args.cache)
+    else:
+        hoja = args.sheet[0] if args.sheet else None
+        dfs = {hoja: leer_excel(args.excel_file, hoja, args.engine, usecols=args.usecols, nrows=args.nrows, cache=args.cache)}
     
     bonito = not args.compact
-    json_str = convertir_a_json(df, args.output, bonito)
-    
-    if not args.output:
-        print("\n📄 Salida JSON:")
-        print(json_str)
-    
-    print(f"\n✅ ¡Conversión de Excel a JSON exitosa!")
-    print(f"   Registros: {len(df)}")
-    print(f"   Campos: {len(df.columns)}")
+    for hoja, df in dfs.items():
+        salida = args.output
+        if salida and len(dfs) > 1:
+            ruta_salida = Path(salida)
+            salida = str(ruta_salida.with_name(f"{ruta_salida.stem}_{hoja}{ruta_salida.suffix}"))
+        
+        if args.preview:
+            print(f"\n📋 Vista previa de los datos{f' de {hoja}' if hoja else ''}:")
+            if _es_polars(df):
+                print(df.head().collect())
+                print(f"\nTipos de datos:")
+                print(df.collect_schema())
+            else:
+                print(df.head())
+                print(f"\nTipos de datos:")
+                print(df.dtypes)
+            print()
+        
+        df = limpiar_dataframe(df, args.fill_empty)
+        if _es_polars(df):
+            df = df.collect()  # Ejecuta en un solo paso el plan de lectura y limpieza
+        
+        json_str = convertir_a_json(df, salida, bonito)
+        
+        if not salida:
+            print("\n📄 Salida JSON:")
+            print(json_str)
+        
+        print(f"\n✅ ¡Conversión de Excel a JSON exitosa!")
+        if len(dfs) > 1:
+            print(f"   Hoja: {hoja}")
+        print(f"   Registros: {len(df)}")
+        print(f"   Campos: {len(df.columns)}")
+
+# Alias en inglés de las mismas funciones
+read_excel_file = leer_excel
+clean_dataframe = limpiar_dataframe
+convert_to_json = convertir_a_json
 
 if __name__ == "__main__":
     main()